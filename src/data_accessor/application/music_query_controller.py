@@ -1,7 +1,12 @@
 from data_accessor.domain.interfaces.abstract_music_query_service import AbstractMusicQueryService
 import logging
+from typing import Any, AsyncIterator
+
+logger = logging.getLogger(__name__)
 
 class MusicQueryController:
+    __slots__ = ("music_query_service",)
+
     def __init__(self, music_query_service: AbstractMusicQueryService) -> None:
         """
         Initialize the controller with a service (dependency injection).
@@ -11,17 +16,26 @@ class MusicQueryController:
     async def fetch_database_schema(self, prompt_embeddings: list[float]) -> list:
         try:
             schema = await self.music_query_service.fetch_database_schema(prompt_embeddings)
-            logging.info("Controller: Fetched database schema.")
+            logger.info("Controller: Fetched database schema.")
             return schema
         except Exception as e:
-            logging.error(f"Controller: Error fetching schema: {e}")
+            logger.error("Controller: Error fetching schema: %s", e)
             raise
 
     async def execute_sql(self, sql: str) -> list:
         try:
             response = await self.music_query_service.execute_sql(sql)
-            logging.info("Controller: SQL executed successfully.")
+            logger.info("Controller: SQL executed successfully.")
             return response
         except Exception as e:
-            logging.error(f"Controller: Error executing SQL: {e}")
+            logger.error("Controller: Error executing SQL: %s", e)
+            raise
+
+    async def stream_sql(self, sql: str) -> AsyncIterator[Any]:
+        try:
+            async for row in self.music_query_service.stream_sql(sql):
+                yield row
+            logger.info("Controller: SQL streamed successfully.")
+        except Exception as e:
+            logger.error("Controller: Error streaming SQL: %s", e)
             raise
\ No newline at end of file
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
 
 class AbstractMusicQueryRepository(ABC):
     """
     Abstract base class for database query repository.
     This class defines the interface for querying data from a database.
     """
+    __slots__ = ()
+
     @abstractmethod
     async def execute_sql(self, sql: str) -> list:
         """
@@ -15,6 +18,16 @@ class AbstractMusicQueryRepository(ABC):
         """
         raise NotImplementedError("This method should be overridden by subclasses.")
     
+    @abstractmethod
+    def stream_sql(self, sql: str) -> AsyncIterator[Any]:
+        """
+        Execute a query and yield the result rows as they arrive.
+
+        :param sql: The SQL query to execute.
+        :return: An async iterator over the result rows.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
     @abstractmethod
     async def fetch_database_schema(self, prompt_embeddings: list[float]) -> list:
         """
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
 
 class AbstractMusicQueryService(ABC):
     """
     Abstract base class for music query services.
     This class defines the interface for executing SQL queries and fetching database schema.
     """
+    __slots__ = ()
+
     @abstractmethod
     async def execute_sql(self, sql: str) -> list:
         """
@@ -15,6 +18,16 @@ class AbstractMusicQueryService(ABC):
         """
         raise NotImplementedError("This method should be overridden by subclasses.")
     
+    @abstractmethod
+    def stream_sql(self, sql: str) -> AsyncIterator[Any]:
+        """
+        Execute a SQL query and yield the result rows as they arrive.
+
+        :param sql: The SQL query to execute.
+        :return: An async iterator over the result rows.
+        """
+        raise NotImplementedError("This method should be overridden by subclasses.")
+
     @abstractmethod
     async def fetch_database_schema(self, prompt_embeddings: list[float]) -> list:
         """
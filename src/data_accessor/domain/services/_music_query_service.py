@@ -4,12 +4,17 @@ if not __name__.startswith("data_accessor"): raise ImportError("_music_query_ser
 from data_accessor.domain.interfaces.abstract_music_query_repository import AbstractMusicQueryRepository
 from data_accessor.domain.interfaces.abstract_music_query_service import AbstractMusicQueryService
 import logging
+from typing import Any, AsyncIterator
+
+logger = logging.getLogger(__name__)
 
 class MusicQueryService(AbstractMusicQueryService):
     """
 	Service class for music queries.
 	This class implements the methods to interact with the music query repository.
 	"""
+    __slots__ = ("repository",)
+
     def __init__(self, repository: AbstractMusicQueryRepository) -> None:
         """
         Initialize the MusicQueryService with a repository (dependency injection).
@@ -19,17 +24,26 @@ class MusicQueryService(AbstractMusicQueryService):
     async def execute_sql(self, sql: str) -> list:
         try:
             result = await self.repository.execute_sql(sql)
-            logging.info("Service: SQL executed successfully.")
+            logger.info("Service: SQL executed successfully.")
             return result
         except Exception as e:
-            logging.error(f"Service: Error executing SQL: {e}")
+            logger.error("Service: Error executing SQL: %s", e)
+            raise
+
+    async def stream_sql(self, sql: str) -> AsyncIterator[Any]:
+        try:
+            async for row in self.repository.stream_sql(sql):
+                yield row
+            logger.info("Service: SQL streamed successfully.")
+        except Exception as e:
+            logger.error("Service: Error streaming SQL: %s", e)
             raise
 
     async def fetch_database_schema(self, prompt_embeddings: list[float]) -> list:
         try:
             schema = await self.repository.fetch_database_schema(prompt_embeddings)
-            logging.info("Service: Fetched database schema.")
+            logger.info("Service: Fetched database schema.")
             return schema
         except Exception as e:
-            logging.error(f"Service: Error fetching schema: {e}")
+            logger.error("Service: Error fetching schema: %s", e)
             raise
\ No newline at end of file
@@ -1,13 +1,20 @@
-import json
-import sqlparse
+import asyncio
+import hashlib
+import orjson
+import re
+import struct
+import time
 import logging
 
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, List, Tuple, Union, Protocol
-from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
-from sqlalchemy.engine import CursorResult
-from sqlalchemy.ext.asyncio.result import AsyncResult
-from sqlalchemy import text
+from functools import lru_cache
+from itertools import chain
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Iterator, List, Optional, Tuple, Union, Protocol
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.engine import CursorResult, Row
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import TextClause, event, text
 
 from data_accessor.domain.interfaces.abstract_music_query_repository import AbstractMusicQueryRepository
 from data_accessor.domain.exceptions.forbidden_sql_statement_exception import ForbiddenSqlStatementException
@@ -16,129 +23,592 @@ from data_accessor.domain.exceptions.sql_statement_execution_exception import Sq
 if not __name__.startswith("data_accessor"):
     raise ImportError("_music_query_repository is internal and cannot be imported directly.")
 
+logger = logging.getLogger(__name__)
+
+
+# Longer queries are rejected outright, bounding the cost of the safety scan
+_MAX_QUERY_LENGTH = 64 * 1024
+# Only queries up to this length are memoized, keeping the per-query caches to a few MiB
+_MAX_CACHED_QUERY_LENGTH = 4 * 1024
+FORBIDDEN_KEYWORDS = frozenset({"DELETE", "INSERT", "UPDATE", "DROP", "CREATE", "ALTER", "COMMIT", "ROLLBACK"})
+# Single-pass SQL tokenizer for the safety check. Quoted literals, quoted identifiers and
+# dollar-quoted strings are matched whole so their contents are never read as keywords;
+# an unterminated quote or a stray "$" falls through to the unsafe group. E'...' strings
+# honour backslash escapes; plain literals rely on standard_conforming_strings being on.
+_SQL_TOKEN_RE = re.compile(
+    r"""(?P<quoted>[Ee]'(?:[^'\\]|\\.|'')*'|'(?:[^']|'')*'|"(?:[^"]|"")*"|\$(?P<tag>(?:[A-Za-z_][A-Za-z0-9_]*)?)\$.*?\$(?P=tag)\$)"""
+    r"|(?P<unsafe>;|--|/\*|['\"$])"
+    r"|(?P<number>[0-9][A-Za-z0-9_.]*)"
+    r"|(?P<word>[A-Za-z_][A-Za-z0-9_$]*)",
+    re.DOTALL
+)
+# Unquoted identifier within PostgreSQL's 63-byte NAMEDATALEN limit
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]{0,62}")
+
+# Rows fetched per server-side cursor round trip when streaming
+_STREAM_BATCH_SIZE = 1024
+
+# pgvector binary wire format: uint16 dimensions, uint16 unused, then big-endian float4 values
+_VECTOR_HEADER = struct.Struct(">HH")
+_VECTOR_SCHEMA_SQL = """
+    SELECT n.nspname
+    FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace
+    WHERE t.typname = 'vector'
+    LIMIT 1
+"""
+
 
 class SqlSafetyChecker(Protocol):
     def is_safe_select_query(self, query: str) -> bool:
         ...
 
-class DefaultSqlSafetyChecker:
+
+@lru_cache(maxsize=4096)
+def _is_safe_select_query(query: str) -> bool:
     """
-    Class responsible for verifying if an SQL query is safe (i.e., a simple SELECT).
+    Cached form of _scan_select_query for short queries, since generated SQL tends to repeat.
     """
+    return _scan_select_query(query)
 
-    def is_safe_select_query(self, query: str) -> bool:
-        parsed = sqlparse.parse(query)
-        if not parsed or len(parsed) != 1:
-            return False
 
-        stmt = parsed[0]
-        stmt_type = stmt.get_type()
-        if stmt_type != 'SELECT':
-            return False
+def _scan_select_query(query: str) -> bool:
+    """
+    Checks whether an SQL query is a simple SELECT with a single scan over its tokens.
+    """
+    first_word = True
+    # Scanned in its original case, since dollar-quote tags are case-sensitive
+    for match in _SQL_TOKEN_RE.finditer(query):
+        kind = match.lastgroup
+        if kind == "word":
+            word = match.group()
+            if not word.isupper():
+                word = word.upper()
+
+            # Must start with SELECT, which also rules out CTEs (WITH ...)
+            if first_word:
+                if word != "SELECT":
+                    return False
+                first_word = False
+
+            # Disallow transaction control and DML/DDL keywords, including inside subqueries
+            elif word in FORBIDDEN_KEYWORDS:
+                return False
 
-        # Disallow CTEs (WITH ...)
-        if any(token.ttype is sqlparse.tokens.CTE and token.value.upper() == "WITH" for token in stmt.tokens):
+        # Disallow semicolons (multiple statements), comments and unterminated quotes
+        elif kind == "unsafe":
             return False
 
-        # Disallow semicolons (multiple statements)
-        if ";" in query:
+        elif first_word:
             return False
 
-        # Disallow comments
-        if "--" in query or "/*" in query:
-            return False
+    return not first_word
+
+
+def _compile_sql(sql: str) -> TextClause:
+    """
+    Wraps caller SQL in a TextClause. Caller SQL has no bind parameters, so colons are
+    escaped and ':name' inside a literal reaches the server unchanged, as it does through
+    execute_sql. Short statements are built once, so repeated streamed queries skip re-parsing.
+    """
+    if len(sql) <= _MAX_CACHED_QUERY_LENGTH:
+        return _cached_text(sql)
+    return text(sql.replace(":", r"\:"))
+
+
+@lru_cache(maxsize=1024)
+def _cached_text(sql: str) -> TextClause:
+    return text(sql.replace(":", r"\:"))
+
+
+def _orjson_dumps(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+def _load_json(value: Any) -> Any:
+    # json columns arrive as text unless a codec has already decoded them
+    return value if isinstance(value, dict) else orjson.loads(value)
+
+
+def _encode_vector(values: Any) -> bytes:
+    return struct.pack(f">HH{len(values)}f", len(values), 0, *values)
+
+
+def _decode_vector(data: bytes) -> list[float]:
+    dimensions, _ = _VECTOR_HEADER.unpack_from(data)
+    return list(struct.unpack_from(f">{dimensions}f", data, _VECTOR_HEADER.size))
+
+
+async def _register_vector_codec(conn: Any) -> None:
+    """
+    Registers a binary codec for the pgvector type on a raw asyncpg connection,
+    if the extension is installed.
+    """
+    schema = await conn.fetchval(_VECTOR_SCHEMA_SQL)
+    if schema is not None:
+        await conn.set_type_codec(
+            "vector",
+            schema=schema,
+            encoder=_encode_vector,
+            decoder=_decode_vector,
+            format="binary"
+        )
+
+
+def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+    dbapi_connection.run_async(_register_vector_codec)
 
-        # Disallow transaction control and DML/DDL keywords
-        forbidden = {"delete", "insert", "update", "drop", "create", "alter", "commit", "rollback"}
-        tokens = [token for token in stmt.tokens if not token.is_whitespace]
-        for token in tokens:
-            if str(token).strip().lower() in forbidden:
-                return False
 
-        return True
+def _start_query_timer(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    context.query_start_time = time.perf_counter()
+
+
+def _slow_query_logger(threshold: float) -> Callable[..., None]:
+    """
+    Builds an after_cursor_execute hook that logs statements slower than threshold seconds,
+    so only the outliers pay for formatting and I/O.
+    """
+    def log_slow_query(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        elapsed = time.perf_counter() - context.query_start_time
+        if elapsed > threshold:
+            logger.warning("Slow query took %.3fs: %s", elapsed, statement)
+
+    return log_slow_query
+
+
+@lru_cache(maxsize=32)
+def _set_search_path_statement(schema_name: str) -> TextClause:
+    """
+    Builds the SET search_path statement for a schema once. The name is interpolated
+    into the SQL, so it must be a plain identifier.
+    """
+    if not _IDENTIFIER_RE.fullmatch(schema_name):
+        raise ValueError(f"Invalid schema name: {schema_name!r}")
+    return text(f"SET search_path TO {schema_name}")
+
+
+def _embedding_cache_key(prompt_embeddings: Union[list[float], str]) -> bytes:
+    """
+    Hashes prompt embeddings into a compact cache key. Lists are hashed as packed float4
+    values, the precision pgvector compares at.
+    """
+    if isinstance(prompt_embeddings, str):
+        data = prompt_embeddings.encode()
+    else:
+        data = _encode_vector(prompt_embeddings)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class _TtlCache:
+    """
+    Bounded in-process cache whose entries expire a fixed number of seconds after being set.
+    The least recently used entry is evicted once the cache is full.
+    """
+    __slots__ = ("_maxsize", "_ttl", "_entries")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[Any, Tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class DefaultSqlSafetyChecker:
+    """
+    Class responsible for verifying if an SQL query is safe (i.e., a simple SELECT).
+    """
+    __slots__ = ()
+
+    def is_safe_select_query(self, query: str) -> bool:
+        if len(query) > _MAX_QUERY_LENGTH:
+            logger.warning("Rejected SQL query of %d characters, limit is %d.", len(query), _MAX_QUERY_LENGTH)
+            return False
+        if len(query) > _MAX_CACHED_QUERY_LENGTH:
+            return _scan_select_query(query)
+        return _is_safe_select_query(query)
 
 
 class MusicQueryRepository(AbstractMusicQueryRepository):
     """
     Repository class for music queries.
     """
+    __slots__ = (
+        "_engine",
+        "_sql_safety_checker",
+        "_default_schema",
+        "_search_path_preset",
+        "_binary_vectors",
+        "_schema_cache",
+        "_schema_version",
+        "_schema_fetches",
+        "_result_cache",
+    )
+
+    # Schema holding schema_embeddings and the pgvector type and operators
+    _META_SCHEMA = "meta"
+
+    # Fetches schema rows by cosine similarity; built once so the statement cache key is stable
+    _SIMILARITY_QUERY = text("""
+        SELECT raw_json
+        FROM meta.schema_embeddings
+        ORDER BY embeddings <#> CAST(:prompt_embeddings AS vector) ASC
+        LIMIT 4
+    """)
 
     def __init__(
         self,
         engine: AsyncEngine,
         sql_safety_checker: SqlSafetyChecker = DefaultSqlSafetyChecker(),
-        default_schema: str = "music"
+        default_schema: str = "music",
+        search_path_preset: bool = False,
+        binary_vectors: bool = False,
+        schema_cache_ttl: float = 300,
+        result_cache_ttl: float = 0
     ) -> None:
+        # Fail fast on a bad default schema rather than on the first query
+        _set_search_path_statement(default_schema)
         self._engine = engine
         self._sql_safety_checker = sql_safety_checker
         self._default_schema = default_schema
+        self._search_path_preset = search_path_preset
+        self._binary_vectors = binary_vectors
+        self._schema_cache = _TtlCache(maxsize=1024, ttl=schema_cache_ttl)
+        self._schema_version = 0
+        self._schema_fetches: dict[bytes, asyncio.Future] = {}
+        # Query results may go stale, so they are only cached when a TTL is given
+        self._result_cache = _TtlCache(maxsize=256, ttl=result_cache_ttl) if result_cache_ttl > 0 else None
+
+    @classmethod
+    async def create(
+        cls,
+        connection_string: str,
+        sql_safety_checker: SqlSafetyChecker = DefaultSqlSafetyChecker(),
+        default_schema: str = "music",
+        pool_size: int = 10,
+        max_overflow: int = 0,
+        pool_recycle: int = 300,
+        pool_pre_ping: bool = False,
+        command_timeout: float = 30,
+        prepared_statement_cache_size: int = 256,
+        application_name: str = "music_query",
+        slow_query_threshold: float = 0.1,
+        warm_connections: Optional[int] = None,
+        schema_cache_ttl: float = 300,
+        result_cache_ttl: float = 0
+    ) -> "MusicQueryRepository":
+        """
+        Builds a repository backed by a warmed, long-lived connection pool; create it once at startup.
+
+        Args:
+            connection_string (str): postgresql+asyncpg:// URL of the database.
+            sql_safety_checker (SqlSafetyChecker): Checker that only lets simple SELECTs through.
+            default_schema (str): Schema put first on the search_path of every connection.
+            pool_size (int): Number of pooled connections.
+            max_overflow (int): Extra connections allowed beyond pool_size.
+            pool_recycle (int): Seconds after which a pooled connection is replaced.
+            pool_pre_ping (bool): Whether to ping connections on every checkout.
+            command_timeout (float): Seconds before a statement is cancelled.
+            prepared_statement_cache_size (int): Prepared statements kept per connection.
+            application_name (str): Name reported in pg_stat_activity.
+            slow_query_threshold (float): Seconds above which a statement is logged.
+            warm_connections (Optional[int]): Connections opened before returning; defaults to pool_size.
+            schema_cache_ttl (float): Seconds fetch_database_schema results are cached.
+            result_cache_ttl (float): Seconds execute_sql results are cached; 0 disables caching.
+
+        Returns:
+            MusicQueryRepository: The repository.
+        """
+        if warm_connections is None:
+            warm_connections = pool_size
+        elif warm_connections < 0:
+            raise ValueError(f"warm_connections must not be negative, got {warm_connections}")
+        elif max_overflow >= 0 and warm_connections > pool_size + max_overflow:
+            # warm_up holds every connection at once, so more than the pool can hold would block;
+            # a negative max_overflow means the pool has no upper limit
+            raise ValueError(
+                f"warm_connections must be at most {pool_size + max_overflow}, got {warm_connections}"
+            )
+
+        engine = create_async_engine(
+            connection_string,
+            echo=False,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            json_serializer=_orjson_dumps,
+            json_deserializer=orjson.loads,
+            connect_args={
+                "command_timeout": command_timeout,
+                "prepared_statement_cache_size": prepared_statement_cache_size,
+                # Applied once per physical connection; JIT costs more than it saves on short SELECTs
+                "server_settings": {
+                    "search_path": f"{default_schema}, {cls._META_SCHEMA}",
+                    "application_name": application_name,
+                    "jit": "off",
+                    "standard_conforming_strings": "on",
+                    "default_transaction_read_only": "on"
+                }
+            }
+        )
+        event.listen(engine.sync_engine, "connect", _on_connect)
+        event.listen(engine.sync_engine, "before_cursor_execute", _start_query_timer)
+        event.listen(engine.sync_engine, "after_cursor_execute", _slow_query_logger(slow_query_threshold))
+        repository = cls(
+            engine=engine,
+            sql_safety_checker=sql_safety_checker,
+            default_schema=default_schema,
+            search_path_preset=True,
+            binary_vectors=True,
+            schema_cache_ttl=schema_cache_ttl,
+            result_cache_ttl=result_cache_ttl
+        )
+        try:
+            await repository.warm_up(warm_connections)
+        except Exception:
+            await engine.dispose()
+            raise
+        return repository
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """
+        Opens pooled connections concurrently and round-trips a trivial query on each, so
+        connection setup happens ahead of the first requests and bad credentials fail at startup.
+        The connections are held together, so the pool cannot hand the same one out twice.
+        """
+        results = await asyncio.gather(
+            *(self._engine.connect() for _ in range(connections)),
+            return_exceptions=True
+        )
+        conns = [result for result in results if not isinstance(result, BaseException)]
+        try:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            await asyncio.gather(*(conn.exec_driver_sql("SELECT 1") for conn in conns))
+        finally:
+            await asyncio.gather(*(conn.close() for conn in conns))
+
+    def clear_schema_cache(self) -> None:
+        """
+        Drops cached fetch_database_schema results, e.g. after the schema embeddings change.
+        Fetches already in flight will not cache what they read from the old embeddings.
+        """
+        self._schema_version += 1
+        self._schema_cache.clear()
+        self._schema_fetches.clear()
+
+    def clear_result_cache(self) -> None:
+        """
+        Drops cached execute_sql results.
+        """
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    async def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+        await self._engine.dispose()
 
     @asynccontextmanager
-    async def get_conn(self, schema_name: str) -> AsyncGenerator[AsyncConnection, None]:
+    async def get_conn(self, schema_name: str, autocommit: bool = False) -> AsyncGenerator[AsyncConnection, None]:
+        """
+        Borrows a pooled connection with schema_name on its search_path.
+
+        With autocommit, a single read skips the BEGIN and ROLLBACK round trips around the
+        checkout. Session changes then outlive the checkout, so it is only for the repository's
+        own fixed statements, never caller SQL, and is skipped when a SET search_path is needed.
+        Server-side cursors need a transaction, so streaming must not use it either.
+
+        Args:
+            schema_name (str): Schema the connection should resolve names in.
+            autocommit (bool): Whether to run statements outside an explicit transaction.
+
+        Yields:
+            AsyncConnection: The borrowed connection.
+        """
+        on_search_path = schema_name in (self._default_schema, self._META_SCHEMA)
+        if self._search_path_preset and on_search_path:
+            set_search_path = None
+        else:
+            # Validated before a connection is borrowed
+            set_search_path = _set_search_path_statement(schema_name)
+
         conn = await self._engine.connect()
         try:
-            await conn.execute(text(f"SET search_path TO {schema_name}"))
+            if set_search_path is not None:
+                await conn.execute(set_search_path)
+            elif autocommit:
+                await conn.execution_options(isolation_level="AUTOCOMMIT")
             yield conn
         finally:
             await conn.close()
 
     async def execute_sql(self, sql: str) -> Union[List[Tuple[Any, ...]], str]:
         if not self._sql_safety_checker.is_safe_select_query(sql):
-            logging.warning(f"Forbidden SQL statement attempted: {sql}")
+            logger.warning("Forbidden SQL statement attempted: %s", sql)
             raise ForbiddenSqlStatementException("Only simple SELECT statements are allowed.")
 
+        # Long statements are not cached, so the cache keys stay small
+        result_cache = self._result_cache if len(sql) <= _MAX_CACHED_QUERY_LENGTH else None
+        if result_cache is not None:
+            cached_rows = result_cache.get(sql)
+            if cached_rows is not None:
+                return list(cached_rows)
+
         try:
+            # Transactional, so any session change made by caller SQL is rolled back at check-in
             async with self.get_conn(self._default_schema) as conn:
-                result: Union[AsyncResult, CursorResult] = await conn.execute(text(sql))
+                # Caller SQL has no bind parameters, so hand it straight to the driver
+                result: CursorResult = await conn.exec_driver_sql(sql)
                 if result.returns_rows:
-                    rows = await result.fetchall()
-                    logging.info(f"SQL executed successfully, returned {len(rows)} rows.")
+                    rows = result.fetchall()
+                    logger.info("SQL executed successfully, returned %d rows.", len(rows))
+                    if result_cache is not None:
+                        # Stored as a tuple so callers cannot mutate the cached rows
+                        result_cache.set(sql, tuple(rows))
                     return rows
                 msg = f"Query executed successfully, {result.rowcount} row(s) affected."
-                logging.info(msg)
+                logger.info(msg)
                 return msg
         except ForbiddenSqlStatementException:
             # already logged above, just re-raise
             raise
         except Exception as e:
-            logging.error(f"Error executing SQL statement: {e}")
+            logger.error("Error executing SQL statement: %s", e)
+            raise SqlStatementExecutionException(f"Error: {type(e).__name__}: {e}") from e
+
+    async def stream_sql(self, sql: str) -> AsyncIterator[Row]:
+        """
+        Executes a SELECT through a server-side cursor and yields rows as they arrive,
+        so large result sets are never materialized in memory at once.
+
+        Args:
+            sql (str): The SQL query to execute.
+
+        Yields:
+            Row: The result rows.
+        """
+        if not self._sql_safety_checker.is_safe_select_query(sql):
+            logger.warning("Forbidden SQL statement attempted: %s", sql)
+            raise ForbiddenSqlStatementException("Only simple SELECT statements are allowed.")
+
+        try:
+            async with self.get_conn(self._default_schema) as conn:
+                result = await conn.stream(
+                    _compile_sql(sql),
+                    execution_options={"yield_per": _STREAM_BATCH_SIZE}
+                )
+                # Pull rows a batch at a time rather than awaiting each row individually
+                async for partition in result.partitions():
+                    for row in partition:
+                        yield row
+                logger.info("SQL streamed successfully.")
+        except Exception as e:
+            logger.error("Error streaming SQL statement: %s", e)
             raise SqlStatementExecutionException(f"Error: {type(e).__name__}: {e}") from e
 
     async def fetch_database_schema(self, prompt_embeddings: list[float]) -> str:
         """
         Fetches the top 4 most similar database schema entries from the 'schema_embeddings' table,
         based on cosine similarity with the given prompt embeddings.
-        
+
+        Results are cached per prompt embedding for schema_cache_ttl seconds, since the
+        schema rarely changes and prompts often repeat. Concurrent calls for the same
+        embedding share a single database query.
+
         Args:
             prompt_embeddings (str): The vector embeddings of the prompt.
 
         Returns:
             str: A human-readable string representation of the schema.
         """
-        query = self._build_similarity_query()
+        try:
+            cache_key = _embedding_cache_key(prompt_embeddings)
+        except (struct.error, TypeError, ValueError) as e:
+            # Malformed embeddings, e.g. non-numeric values or more than 65535 dimensions
+            logger.error("Error fetching database schema: %s", e)
+            raise SqlStatementExecutionException(f"Error: {type(e).__name__}: {e}") from e
 
+        schema = self._schema_cache.get(cache_key)
+        if schema is not None:
+            return schema
+
+        fetch = self._schema_fetches.get(cache_key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._load_database_schema(cache_key, prompt_embeddings))
+            self._schema_fetches[cache_key] = fetch
+            fetch.add_done_callback(lambda done: self._forget_schema_fetch(cache_key, done))
+
+        # Shielded so one cancelled caller does not cancel the query for the others
+        return await asyncio.shield(fetch)
+
+    def _forget_schema_fetch(self, cache_key: bytes, fetch: asyncio.Future) -> None:
+        if self._schema_fetches.get(cache_key) is fetch:
+            del self._schema_fetches[cache_key]
+
+    async def _load_database_schema(self, cache_key: bytes, prompt_embeddings: Union[list[float], str]) -> str:
+        """
+        Queries and formats the schema entries for fetch_database_schema and caches the result,
+        unless the cache was cleared while the query ran.
+
+        Args:
+            cache_key (bytes): Cache key of the prompt embeddings.
+            prompt_embeddings (str): The vector embeddings of the prompt.
+
+        Returns:
+            str: A human-readable string representation of the schema.
+        """
+        schema_version = self._schema_version
         try:
-            async with self.get_conn("meta") as conn:
-                embedding_str = f"[{','.join(map(str, prompt_embeddings))}]"
-                result = await conn.execute(query, {"prompt_embeddings": embedding_str})
-                rows = await result.fetchall()
+            async with self.get_conn(self._META_SCHEMA, autocommit=True) as conn:
+                params = {"prompt_embeddings": self._bind_embeddings(prompt_embeddings)}
+                result = await conn.execute(self._SIMILARITY_QUERY, params)
+                rows = result.fetchall()
 
-            return self._format_schema_rows(rows)
+            schema = self._format_schema_rows(rows)
+            if schema_version == self._schema_version:
+                self._schema_cache.set(cache_key, schema)
+            return schema
 
         except Exception as e:
-            logging.error(f"Error fetching database schema: {e}", exc_info=True)
+            logger.error("Error fetching database schema: %s", e, exc_info=True)
             raise SqlStatementExecutionException(f"Error: {type(e).__name__}: {e}")
 
-    def _build_similarity_query(self) -> text:
+    def _bind_embeddings(self, prompt_embeddings: Union[list[float], str]) -> Union[list[float], str]:
         """
-        Builds the SQL query for fetching schema rows by cosine similarity.
+        Converts the prompt embeddings into the bind value for the similarity query.
+
+        With the binary pgvector codec the values are passed through and packed by the
+        driver; otherwise they are rendered as a pgvector text literal.
         """
-        return text("""
-            SELECT raw_json, (embeddings <#> CAST(:prompt_embeddings AS vector)) as cosine_similarity
-            FROM schema_embeddings
-            ORDER BY cosine_similarity ASC
-            LIMIT 4
-        """)
+        if self._binary_vectors:
+            return orjson.loads(prompt_embeddings) if isinstance(prompt_embeddings, str) else prompt_embeddings
+        if isinstance(prompt_embeddings, str):
+            return prompt_embeddings
+        return f"[{','.join(map(str, prompt_embeddings))}]"
 
     def _format_schema_rows(self, rows: list) -> str:
         """
@@ -150,29 +620,28 @@ class MusicQueryRepository(AbstractMusicQueryRepository):
         Returns:
             str: Formatted schema string.
         """
-        schema_lines = []
-
-        for raw_json, in rows:
-            data = json.loads(raw_json)
-            schema_lines.extend(self._format_single_schema(data))
-            schema_lines.append("")  # Add spacing between tables
+        # Each row's lines are followed by an empty line to add spacing between tables
+        schema_lines = chain.from_iterable(
+            chain(self._format_single_schema(_load_json(raw_json)), ("",))
+            for raw_json, in rows
+        )
+        schema = "\n".join(schema_lines)
 
-        logging.info("Fetched database schema for meta")
-        return "\n".join(schema_lines)
+        logger.info("Fetched database schema for meta")
+        return schema
 
-    def _format_single_schema(self, raw_json: dict) -> list[str]:
+    def _format_single_schema(self, raw_json: dict) -> Iterator[str]:
         """
         Formats a single raw_json schema entry.
 
         Args:
             raw_json (dict): Parsed JSON of a schema row.
 
-        Returns:
-            list[str]: Lines of formatted schema.
+        Yields:
+            str: Lines of formatted schema.
         """
-        lines = []
         for table_name, table_info in raw_json.items():
-            lines.append(f"{table_name}:")
+            yield f"{table_name}:"
             if isinstance(table_info, dict):
                 columns = table_info.get('columns', {})
                 for column_name, column_info in columns.items():
@@ -181,5 +650,4 @@ class MusicQueryRepository(AbstractMusicQueryRepository):
                         if isinstance(column_info, dict)
                         else str(column_info)
                     )
-                    lines.append(f"  {column_name}: {description}")
-        return lines
+                    yield f"  {column_name}: {description}"
@@ -0,0 +1,3 @@
+async def _aiter(items):
+    for item in items:
+        yield item
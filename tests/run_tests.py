@@ -16,7 +16,7 @@ def run_tests_with_coverage():
     # Discover and run tests
     loader = unittest.TestLoader()
     tests_dir = os.path.dirname(os.path.abspath(__file__))
-    suite = loader.discover(tests_dir)
+    suite = loader.discover(tests_dir, top_level_dir=os.path.dirname(tests_dir))
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
@@ -1,8 +1,10 @@
 import unittest
 import asyncio
-from unittest.mock import AsyncMock, create_autospec    
+from unittest.mock import AsyncMock, MagicMock, create_autospec    
 from data_accessor.domain.interfaces.abstract_music_query_service import AbstractMusicQueryService
 from data_accessor.application.music_query_controller import MusicQueryController
+from tests._helpers import _aiter
+
 
 class TestMusicQueryController(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
@@ -31,5 +33,15 @@ class TestMusicQueryController(unittest.IsolatedAsyncioTestCase):
         self.mock_service.execute_sql.assert_awaited_once_with(sql)
         self.assertEqual(result, mock_response)
 
+    async def test_stream_sql(self):
+        sql = "SELECT * FROM songs"
+        mock_rows = [(1, "Imagine"), (2, "Yesterday")]
+        self.mock_service.stream_sql = MagicMock(return_value=_aiter(mock_rows))
+
+        result = [row async for row in self.controller.stream_sql(sql)]
+
+        self.mock_service.stream_sql.assert_called_once_with(sql)
+        self.assertEqual(result, mock_rows)
+
 if __name__ == '__main__':
     unittest.main()
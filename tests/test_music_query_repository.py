@@ -1,10 +1,27 @@
 import asyncio
+import orjson
 import unittest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from data_accessor.domain.exceptions.forbidden_sql_statement_exception import ForbiddenSqlStatementException
 from data_accessor.domain.exceptions.sql_statement_execution_exception import SqlStatementExecutionException
-from data_accessor.infrastructure.repositories._music_query_repository import DefaultSqlSafetyChecker, MusicQueryRepository
+from data_accessor.infrastructure.repositories._music_query_repository import (
+    DefaultSqlSafetyChecker,
+    MusicQueryRepository,
+    _decode_vector,
+    _encode_vector,
+    _is_safe_select_query,
+    _on_connect,
+    _register_vector_codec,
+    _set_search_path_statement,
+    _slow_query_logger,
+    _start_query_timer,
+    _TtlCache,
+)
+from tests._helpers import _aiter
+
 
 class TestDefaultSqlSafetyChecker(unittest.TestCase):
     def setUp(self):
@@ -30,6 +47,119 @@ class TestDefaultSqlSafetyChecker(unittest.TestCase):
         query = "SELECT * FROM songs -- comment"
         self.assertFalse(self.checker.is_safe_select_query(query))
 
+    def test_forbidden_keyword_in_subquery(self):
+        query = "SELECT * FROM (DELETE FROM songs RETURNING *) AS deleted"
+        self.assertFalse(self.checker.is_safe_select_query(query))
+
+    def test_repeated_query_is_cached(self):
+        query = "SELECT title FROM songs WHERE song_id = 42"
+        hits_before = _is_safe_select_query.cache_info().hits
+
+        self.assertTrue(self.checker.is_safe_select_query(query))
+        self.assertTrue(self.checker.is_safe_select_query(query))
+
+        self.assertGreater(_is_safe_select_query.cache_info().hits, hits_before)
+
+    def test_oversized_query_is_rejected_without_scanning(self):
+        query = "SELECT * FROM songs WHERE song_id IN (" + "1, " * 30000 + "1)"
+        misses_before = _is_safe_select_query.cache_info().misses
+
+        with self.assertLogs("data_accessor.infrastructure.repositories._music_query_repository", "WARNING"):
+            self.assertFalse(self.checker.is_safe_select_query(query))
+
+        self.assertEqual(_is_safe_select_query.cache_info().misses, misses_before)
+
+    def test_long_query_is_scanned_without_caching(self):
+        query = "SELECT * FROM songs WHERE song_id IN (" + "1, " * 2000 + "1)"
+        misses_before = _is_safe_select_query.cache_info().misses
+
+        self.assertTrue(self.checker.is_safe_select_query(query))
+        self.assertFalse(self.checker.is_safe_select_query(query + "; DROP TABLE songs"))
+
+        self.assertEqual(_is_safe_select_query.cache_info().misses, misses_before)
+
+    def test_unterminated_quote(self):
+        query = "SELECT * FROM songs WHERE title = 'x"
+        self.assertFalse(self.checker.is_safe_select_query(query))
+
+    def test_dollar_quote_tags_are_case_sensitive(self):
+        query = "SELECT $a$ $A$ $a$; DROP TABLE songs; SELECT $A$ $a$ $A$"
+        self.assertFalse(self.checker.is_safe_select_query(query))
+
+    def test_statement_hidden_behind_escape_string(self):
+        query = r"SELECT E'\'' FROM songs; DELETE FROM songs; SELECT E'\''"
+        self.assertFalse(self.checker.is_safe_select_query(query))
+
+    def test_escape_string_with_escaped_quote(self):
+        query = r"SELECT * FROM songs WHERE title = E'Don\'t Stop'"
+        self.assertTrue(self.checker.is_safe_select_query(query))
+
+    def test_dollar_quoted_string(self):
+        query = "SELECT * FROM songs WHERE title = $$Drop It; Don't Stop$$"
+        self.assertTrue(self.checker.is_safe_select_query(query))
+
+    def test_statement_hidden_behind_dollar_quote(self):
+        query = "SELECT $$'$$; DROP TABLE songs; SELECT 'x'"
+        self.assertFalse(self.checker.is_safe_select_query(query))
+
+    def test_forbidden_words_inside_quotes_are_allowed(self):
+        query = "SELECT \"update\" FROM songs WHERE title = 'Dancing with Myself' OR title = 'Drop It'"
+        self.assertTrue(self.checker.is_safe_select_query(query))
+
+    def test_leading_whitespace_and_lowercase_select(self):
+        query = "\n  select title from songs"
+        self.assertTrue(self.checker.is_safe_select_query(query))
+
+    def test_with_outside_cte_is_allowed(self):
+        query = "SELECT CAST(released_at AS timestamp with time zone) FROM songs"
+        self.assertTrue(self.checker.is_safe_select_query(query))
+
+class TestTtlCache(unittest.TestCase):
+    def test_get_returns_value_before_expiry(self):
+        cache = _TtlCache(maxsize=2, ttl=60)
+        cache.set("key", "value")
+        self.assertEqual(cache.get("key"), "value")
+
+    def test_get_expires_entries(self):
+        cache = _TtlCache(maxsize=2, ttl=60)
+        with patch("data_accessor.infrastructure.repositories._music_query_repository.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 100.0
+            cache.set("key", "value")
+            mock_monotonic.return_value = 161.0
+            self.assertIsNone(cache.get("key"))
+
+    def test_set_evicts_least_recently_used(self):
+        cache = _TtlCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+class TestSlowQueryLogger(unittest.TestCase):
+    def _run_query(self, elapsed: float) -> None:
+        context = MagicMock()
+        log_slow_query = _slow_query_logger(threshold=0.1)
+        with patch(
+            "data_accessor.infrastructure.repositories._music_query_repository.time.perf_counter",
+            side_effect=[10.0, 10.0 + elapsed]
+        ):
+            _start_query_timer(None, None, "SELECT 1", (), context, False)
+            log_slow_query(None, None, "SELECT 1", (), context, False)
+
+    def test_logs_slow_query(self):
+        with self.assertLogs("data_accessor.infrastructure.repositories._music_query_repository", "WARNING") as logs:
+            self._run_query(elapsed=0.5)
+
+        self.assertIn("SELECT 1", logs.output[0])
+
+    def test_ignores_fast_query(self):
+        with self.assertNoLogs("data_accessor.infrastructure.repositories._music_query_repository", "WARNING"):
+            self._run_query(elapsed=0.01)
+
 class TestMusicQueryRepository(unittest.IsolatedAsyncioTestCase):
 
     async def asyncSetUp(self):
@@ -37,17 +167,25 @@ class TestMusicQueryRepository(unittest.IsolatedAsyncioTestCase):
         self.mock_conn = AsyncMock()
         self.mock_engine.connect.return_value = self.mock_conn
 
-        self.mock_result = AsyncMock()
+        # AsyncConnection.execute returns a buffered result, so fetchall is synchronous
+        self.mock_result = MagicMock()
         self.mock_result.returns_rows = True
-        self.mock_result.fetchall = AsyncMock(return_value=[("row1",), ("row2",)])
+        self.mock_result.fetchall.return_value = [("row1",), ("row2",)]
 
         self.mock_conn.execute.return_value = self.mock_result
+        self.mock_conn.exec_driver_sql.return_value = self.mock_result
         self.mock_conn.close = AsyncMock()
 
         self.repo = MusicQueryRepository(
             engine=self.mock_engine
         )
 
+    def _mock_stream(self, *partitions):
+        # AsyncConnection.stream returns a streaming result read through partitions()
+        stream_result = MagicMock()
+        stream_result.partitions = MagicMock(side_effect=lambda: _aiter(partitions))
+        self.mock_conn.stream = AsyncMock(return_value=stream_result)
+
     async def test_execute_sql_valid(self):
         sql = "SELECT * FROM songs"
         result = await self.repo.execute_sql(sql)
@@ -55,19 +193,297 @@ class TestMusicQueryRepository(unittest.IsolatedAsyncioTestCase):
         # Verify return result
         self.assertEqual(result, [("row1",), ("row2",)])
 
-        # Assert execute was called twice: once for search_path, once for query
-        self.assertEqual(self.mock_conn.execute.call_count, 2)
-
-        # Optional: Check both calls
-        call_args_list = self.mock_conn.execute.call_args_list
-
         # First call: SET search_path
-        set_path_sql = str(call_args_list[0][0][0])
+        self.mock_conn.execute.assert_awaited_once()
+        set_path_sql = str(self.mock_conn.execute.call_args[0][0])
         self.assertIn("SET search_path TO music", set_path_sql)
 
-        # Second call: SELECT
-        select_sql = str(call_args_list[1][0][0])
-        self.assertIn("SELECT * FROM songs", select_sql)
+        # Second call: the SELECT, passed to the driver as-is
+        self.mock_conn.exec_driver_sql.assert_awaited_once_with(sql)
+
+    async def test_execute_sql_search_path_preset(self):
+        repo = MusicQueryRepository(engine=self.mock_engine, search_path_preset=True)
+        result = await repo.execute_sql("SELECT * FROM songs")
+
+        self.assertEqual(result, [("row1",), ("row2",)])
+
+        # The pool already set search_path, so only the query itself is executed
+        self.mock_conn.execute.assert_not_awaited()
+        self.mock_conn.exec_driver_sql.assert_awaited_once_with("SELECT * FROM songs")
+
+    async def test_execute_sql_stays_transactional(self):
+        repo = MusicQueryRepository(engine=self.mock_engine, search_path_preset=True)
+
+        await repo.execute_sql("SELECT set_config('default_transaction_read_only', 'off', false)")
+
+        # Caller SQL must not run in autocommit, or its session changes would outlive the checkout
+        self.mock_conn.execution_options.assert_not_awaited()
+
+    async def test_execute_sql_stays_transactional_when_setting_search_path(self):
+        await self.repo.execute_sql("SELECT * FROM songs")
+
+        # The SET must be rolled back with the transaction rather than leak into the pool
+        self.mock_conn.execution_options.assert_not_awaited()
+
+    async def test_stream_sql_stays_transactional(self):
+        repo = MusicQueryRepository(engine=self.mock_engine, search_path_preset=True)
+        self._mock_stream()
+
+        [row async for row in repo.stream_sql("SELECT * FROM songs")]
+
+        self.mock_conn.execution_options.assert_not_awaited()
+
+    async def test_fetch_database_schema_search_path_preset(self):
+        repo = MusicQueryRepository(engine=self.mock_engine, search_path_preset=True)
+        self.mock_result.fetchall.return_value = []
+
+        await repo.fetch_database_schema([0.1, 0.2, 0.3])
+
+        # The meta schema is on the preset search_path too, so only the similarity query runs
+        self.mock_conn.execute.assert_awaited_once()
+        self.assertIn("FROM meta.schema_embeddings", str(self.mock_conn.execute.call_args[0][0]))
+
+        # The fixed similarity query skips the BEGIN/ROLLBACK round trips
+        self.mock_conn.execution_options.assert_awaited_once_with(isolation_level="AUTOCOMMIT")
+
+    async def test_create_configures_pool(self):
+        with patch(
+            "data_accessor.infrastructure.repositories._music_query_repository.create_async_engine"
+        ) as mock_create_engine, patch(
+            "data_accessor.infrastructure.repositories._music_query_repository.event"
+        ) as mock_event:
+            mock_create_engine.return_value = self.mock_engine
+            repo = await MusicQueryRepository.create("postgresql+asyncpg://u:p@h/db", pool_size=5)
+
+        _, kwargs = mock_create_engine.call_args
+        self.assertFalse(kwargs["echo"])
+        self.assertEqual(kwargs["pool_size"], 5)
+        self.assertEqual(kwargs["max_overflow"], 0)
+        self.assertIs(kwargs["poolclass"], AsyncAdaptedQueuePool)
+        self.assertFalse(kwargs["pool_pre_ping"])
+        self.assertIs(kwargs["json_deserializer"], orjson.loads)
+        connect_args = kwargs["connect_args"]
+        self.assertEqual(connect_args["command_timeout"], 30)
+        self.assertEqual(connect_args["prepared_statement_cache_size"], 256)
+        self.assertEqual(connect_args["server_settings"], {
+            "search_path": "music, meta",
+            "application_name": "music_query",
+            "jit": "off",
+            "standard_conforming_strings": "on",
+            "default_transaction_read_only": "on"
+        })
+        self.assertTrue(repo._search_path_preset)
+        self.assertTrue(repo._binary_vectors)
+        sync_engine = mock_create_engine.return_value.sync_engine
+        mock_event.listen.assert_any_call(sync_engine, "connect", _on_connect)
+        mock_event.listen.assert_any_call(sync_engine, "before_cursor_execute", _start_query_timer)
+
+        # The whole pool is warmed before the repository is handed out
+        self.assertEqual(self.mock_engine.connect.await_count, 5)
+        self.mock_conn.exec_driver_sql.assert_awaited_with("SELECT 1")
+        self.assertEqual(self.mock_conn.close.await_count, 5)
+
+    async def test_create_forwards_schema_cache_ttl(self):
+        with patch(
+            "data_accessor.infrastructure.repositories._music_query_repository.create_async_engine"
+        ) as mock_create_engine, patch(
+            "data_accessor.infrastructure.repositories._music_query_repository.event"
+        ):
+            mock_create_engine.return_value = self.mock_engine
+            repo = await MusicQueryRepository.create("postgresql+asyncpg://u:p@h/db", schema_cache_ttl=5)
+
+        self.assertEqual(repo._schema_cache._ttl, 5)
+
+    async def test_create_rejects_more_warm_connections_than_pool_holds(self):
+        with patch(
+            "data_accessor.infrastructure.repositories._music_query_repository.create_async_engine"
+        ) as mock_create_engine:
+            with self.assertRaises(ValueError):
+                await MusicQueryRepository.create("postgresql+asyncpg://u:p@h/db", pool_size=5, warm_connections=6)
+
+        mock_create_engine.assert_not_called()
+
+    async def test_create_allows_warm_connections_with_unlimited_overflow(self):
+        with patch(
+            "data_accessor.infrastructure.repositories._music_query_repository.create_async_engine"
+        ) as mock_create_engine, patch(
+            "data_accessor.infrastructure.repositories._music_query_repository.event"
+        ):
+            mock_create_engine.return_value = self.mock_engine
+            await MusicQueryRepository.create(
+                "postgresql+asyncpg://u:p@h/db", pool_size=10, max_overflow=-1, warm_connections=12
+            )
+
+        self.assertEqual(self.mock_engine.connect.await_count, 12)
+
+    async def test_warm_up_closes_opened_connections_when_one_fails(self):
+        self.mock_engine.connect.side_effect = [self.mock_conn, OSError("connection refused")]
+
+        with self.assertRaises(OSError):
+            await self.repo.warm_up(2)
+
+        self.mock_conn.close.assert_awaited_once()
+
+    async def test_fetch_database_schema_binary_vectors(self):
+        repo = MusicQueryRepository(engine=self.mock_engine, binary_vectors=True)
+        self.mock_result.fetchall.return_value = []
+
+        await repo.fetch_database_schema("[0.1, 0.2, 0.3]")
+
+        # The driver codec packs the values, so they are bound as a list rather than a literal
+        params = self.mock_conn.execute.call_args[0][1]
+        self.assertEqual(params, {"prompt_embeddings": [0.1, 0.2, 0.3]})
+
+    async def test_fetch_database_schema_text_vectors(self):
+        self.mock_result.fetchall.return_value = []
+
+        await self.repo.fetch_database_schema([0.5, -1.0])
+
+        params = self.mock_conn.execute.call_args[0][1]
+        self.assertEqual(params, {"prompt_embeddings": "[0.5,-1.0]"})
+
+    async def test_register_vector_codec(self):
+        raw_conn = AsyncMock()
+        raw_conn.fetchval.return_value = "meta"
+
+        await _register_vector_codec(raw_conn)
+
+        _, kwargs = raw_conn.set_type_codec.call_args
+        self.assertEqual(kwargs["schema"], "meta")
+        self.assertEqual(kwargs["format"], "binary")
+
+    async def test_register_vector_codec_without_extension(self):
+        raw_conn = AsyncMock()
+        raw_conn.fetchval.return_value = None
+
+        await _register_vector_codec(raw_conn)
+
+        raw_conn.set_type_codec.assert_not_awaited()
+
+    def test_vector_codec_round_trip(self):
+        values = [0.5, -1.25, 3.0]
+        encoded = _encode_vector(values)
+
+        self.assertEqual(len(encoded), 4 + 4 * len(values))
+        self.assertEqual(_decode_vector(encoded), values)
+
+    async def test_execute_sql_results_not_cached_by_default(self):
+        await self.repo.execute_sql("SELECT * FROM songs")
+        await self.repo.execute_sql("SELECT * FROM songs")
+
+        self.assertEqual(self.mock_conn.exec_driver_sql.await_count, 2)
+
+    async def test_execute_sql_results_cached_with_ttl(self):
+        repo = MusicQueryRepository(engine=self.mock_engine, result_cache_ttl=60)
+
+        first = await repo.execute_sql("SELECT * FROM songs")
+        first.clear()
+        second = await repo.execute_sql("SELECT * FROM songs")
+
+        self.assertEqual(second, [("row1",), ("row2",)])
+        self.mock_conn.exec_driver_sql.assert_awaited_once()
+
+        repo.clear_result_cache()
+        await repo.execute_sql("SELECT * FROM songs")
+        self.assertEqual(self.mock_conn.exec_driver_sql.await_count, 2)
+
+    async def test_execute_sql_does_not_cache_long_statements(self):
+        repo = MusicQueryRepository(engine=self.mock_engine, result_cache_ttl=60)
+        sql = "SELECT * FROM songs WHERE song_id IN (" + "1, " * 2000 + "1)"
+
+        await repo.execute_sql(sql)
+        await repo.execute_sql(sql)
+
+        self.assertEqual(self.mock_conn.exec_driver_sql.await_count, 2)
+
+    async def test_execute_sql_no_rows(self):
+        self.mock_result.returns_rows = False
+        self.mock_result.rowcount = 0
+
+        result = await self.repo.execute_sql("SELECT * FROM songs")
+
+        self.assertEqual(result, "Query executed successfully, 0 row(s) affected.")
+
+    async def test_stream_sql_reuses_compiled_statement(self):
+        self._mock_stream()
+
+        sql = "SELECT * FROM songs"
+        [row async for row in self.repo.stream_sql(sql)]
+        [row async for row in self.repo.stream_sql(sql)]
+
+        first_statement = self.mock_conn.stream.call_args_list[0][0][0]
+        second_statement = self.mock_conn.stream.call_args_list[1][0][0]
+        self.assertIs(first_statement, second_statement)
+
+    async def test_stream_sql_yields_rows(self):
+        self._mock_stream([("row1",), ("row2",)], [("row3",)])
+
+        result = [row async for row in self.repo.stream_sql("SELECT * FROM songs")]
+
+        self.assertEqual(result, [("row1",), ("row2",), ("row3",)])
+        self.assertIn("SELECT * FROM songs", str(self.mock_conn.stream.call_args[0][0]))
+        self.assertEqual(self.mock_conn.stream.call_args[1]["execution_options"], {"yield_per": 1024})
+        self.mock_conn.close.assert_awaited_once()
+
+    async def test_stream_sql_does_not_cache_long_statements(self):
+        self._mock_stream()
+
+        sql = "SELECT * FROM songs WHERE song_id IN (" + "1, " * 2000 + "1)"
+        [row async for row in self.repo.stream_sql(sql)]
+        [row async for row in self.repo.stream_sql(sql)]
+
+        first_statement = self.mock_conn.stream.call_args_list[0][0][0]
+        second_statement = self.mock_conn.stream.call_args_list[1][0][0]
+        self.assertIsNot(first_statement, second_statement)
+        self.assertEqual(str(first_statement), sql)
+
+    async def test_stream_sql_keeps_colons_in_literals(self):
+        self._mock_stream()
+
+        sql = "SELECT title::text FROM songs WHERE title = 'Re: :live'"
+        [row async for row in self.repo.stream_sql(sql)]
+
+        statement = self.mock_conn.stream.call_args[0][0]
+        self.assertEqual(statement._bindparams, {})
+        self.assertEqual(str(statement), sql)
+
+    async def test_stream_sql_forbidden(self):
+        with self.assertRaises(ForbiddenSqlStatementException):
+            async for _ in self.repo.stream_sql("DROP TABLE songs"):
+                pass
+
+    async def test_stream_sql_exception(self):
+        self.mock_conn.stream = AsyncMock(side_effect=Exception("DB failure"))
+
+        with self.assertRaises(SqlStatementExecutionException):
+            async for _ in self.repo.stream_sql("SELECT * FROM songs"):
+                pass
+
+    async def test_get_conn_rejects_invalid_schema_name(self):
+        with self.assertRaises(ValueError):
+            async with self.repo.get_conn("music; DROP TABLE songs"):
+                pass
+
+        self.mock_engine.connect.assert_not_awaited()
+
+    def test_init_rejects_invalid_default_schema(self):
+        with self.assertRaises(ValueError):
+            MusicQueryRepository(engine=self.mock_engine, default_schema="music; DROP TABLE songs")
+
+    def test_set_search_path_statement_rejects_overlong_name(self):
+        self.assertIsNotNone(_set_search_path_statement("s" * 63))
+        with self.assertRaises(ValueError):
+            _set_search_path_statement("s" * 64)
+
+    async def test_get_conn_reuses_search_path_statement(self):
+        async with self.repo.get_conn("music"):
+            pass
+        async with self.repo.get_conn("music"):
+            pass
+
+        first_statement, second_statement = (call[0][0] for call in self.mock_conn.execute.call_args_list)
+        self.assertIs(first_statement, second_statement)
+        self.assertIs(first_statement, _set_search_path_statement("music"))
 
     async def test_execute_sql_forbidden(self):
         sql = "DROP TABLE songs"
@@ -76,7 +492,7 @@ class TestMusicQueryRepository(unittest.IsolatedAsyncioTestCase):
 
     async def test_execute_sql_exception(self):
         sql = "SELECT * FROM songs"
-        self.mock_conn.execute.side_effect = Exception("DB failure")
+        self.mock_conn.exec_driver_sql.side_effect = Exception("DB failure")
 
         with self.assertRaises(SqlStatementExecutionException):
             await self.repo.execute_sql(sql)
@@ -95,7 +511,7 @@ class TestMusicQueryRepository(unittest.IsolatedAsyncioTestCase):
             }
         }'''
 
-        self.mock_result.fetchall = AsyncMock(return_value=[(mock_schema_json,)])
+        self.mock_result.fetchall.return_value = [(mock_schema_json,)]
         self.mock_conn.execute.return_value = self.mock_result
 
         result = await self.repo.fetch_database_schema([0.1, 0.2, 0.3])
@@ -107,6 +523,90 @@ class TestMusicQueryRepository(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(result, expected)
 
+    def test_format_schema_rows_accepts_decoded_json(self):
+        rows = [({"album": {"columns": {"title": {"column_description": "The album title"}}}},)]
+
+        result = self.repo._format_schema_rows(rows)
+
+        self.assertEqual(result, "album:\n  title: The album title\n")
+
+    async def test_fetch_database_schema_cached(self):
+        self.mock_result.fetchall.return_value = [('{"album": {"columns": {"title": "Title"}}}',)]
+
+        first = await self.repo.fetch_database_schema([0.1, 0.2, 0.3])
+        second = await self.repo.fetch_database_schema([0.1, 0.2, 0.3])
+
+        self.assertEqual(first, second)
+        self.mock_engine.connect.assert_awaited_once()
+
+    async def test_fetch_database_schema_cache_keyed_by_embedding(self):
+        self.mock_result.fetchall.return_value = []
+
+        await self.repo.fetch_database_schema([0.1, 0.2, 0.3])
+        await self.repo.fetch_database_schema([0.3, 0.2, 0.1])
+
+        self.assertEqual(self.mock_engine.connect.await_count, 2)
+
+    async def test_fetch_database_schema_malformed_embeddings(self):
+        with self.assertRaises(SqlStatementExecutionException):
+            await self.repo.fetch_database_schema([0.1, "x"])
+        with self.assertRaises(SqlStatementExecutionException):
+            await self.repo.fetch_database_schema([0.1] * 65536)
+
+        self.mock_engine.connect.assert_not_awaited()
+
+    async def test_clear_schema_cache(self):
+        self.mock_result.fetchall.return_value = []
+
+        await self.repo.fetch_database_schema([0.1, 0.2, 0.3])
+        self.repo.clear_schema_cache()
+        await self.repo.fetch_database_schema([0.1, 0.2, 0.3])
+
+        self.assertEqual(self.mock_engine.connect.await_count, 2)
+
+    async def test_concurrent_fetches_share_one_query(self):
+        self.mock_result.fetchall.return_value = [('{"album": {"columns": {}}}',)]
+
+        first, second = await asyncio.gather(
+            self.repo.fetch_database_schema([0.1, 0.2, 0.3]),
+            self.repo.fetch_database_schema([0.1, 0.2, 0.3])
+        )
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.mock_engine.connect.await_count, 1)
+        self.assertEqual(self.repo._schema_fetches, {})
+
+    async def test_clear_schema_cache_during_fetch_skips_stale_result(self):
+        self.mock_result.fetchall.return_value = []
+
+        async def execute(*args, **kwargs):
+            self.repo.clear_schema_cache()
+            return self.mock_result
+
+        self.mock_conn.execute.side_effect = execute
+        await self.repo.fetch_database_schema([0.1, 0.2, 0.3])
+        self.mock_conn.execute.side_effect = None
+        await self.repo.fetch_database_schema([0.1, 0.2, 0.3])
+
+        self.assertEqual(self.mock_engine.connect.await_count, 2)
+
+    def test_format_schema_rows_separates_tables(self):
+        rows = [
+            ('{"album": {"columns": {"title": {"column_description": "The album title"}}}}',),
+            ('{"track": {"columns": {"name": "The track name"}}}',),
+        ]
+
+        result = self.repo._format_schema_rows(rows)
+
+        expected = (
+            "album:\n"
+            "  title: The album title\n"
+            "\n"
+            "track:\n"
+            "  name: The track name\n"
+        )
+        self.assertEqual(result, expected)
+
     def test_format_single_schema(self):
         repo = MusicQueryRepository(engine=AsyncMock())
         raw_json = {
@@ -118,7 +618,7 @@ class TestMusicQueryRepository(unittest.IsolatedAsyncioTestCase):
             }
         }
 
-        result = repo._format_single_schema(raw_json)
+        result = list(repo._format_single_schema(raw_json))
         expected = [
             "songs:",
             "  title: The title of the song",
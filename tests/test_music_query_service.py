@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, MagicMock
 
 from data_accessor.domain.interfaces.abstract_music_query_repository import AbstractMusicQueryRepository
 from data_accessor.domain.services._music_query_service import MusicQueryService
+from tests._helpers import _aiter
+
 
 class TestMusicQueryService(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
@@ -54,5 +56,18 @@ class TestMusicQueryService(unittest.IsolatedAsyncioTestCase):
         self.mock_repository.execute_sql.assert_awaited_once_with(sql_query)
         self.assertEqual(result, expected_result)
 
+    async def test_stream_sql_yields_repository_rows(self):
+        # Arrange
+        sql_query = "SELECT * FROM songs"
+        expected_rows = [(1, "Imagine"), (2, "Yesterday")]
+        self.mock_repository.stream_sql = MagicMock(return_value=_aiter(expected_rows))
+
+        # Act
+        result = [row async for row in self.service.stream_sql(sql_query)]
+
+        # Assert
+        self.mock_repository.stream_sql.assert_called_once_with(sql_query)
+        self.assertEqual(result, expected_rows)
+
 if __name__ == '__main__':
     unittest.main()